@@ -6,26 +6,104 @@ Cross-platform support for Linux distributions
 """
 
 import os
+import re
 import sys
+import io
 import yaml
 import csv
 import glob
+import zipfile
+import heapq
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict, Counter
+from operator import itemgetter
+from xml.sax.saxutils import escape, quoteattr
 
 # Try to import ODS library
 try:
     from odf.opendocument import OpenDocumentSpreadsheet
     from odf.style import Style, TableCellProperties, TextProperties
-    from odf.text import P
-    from odf.table import Table, TableColumn, TableRow, TableCell
+    from odf.table import Table, TableColumn, TableCell
+    from odf.element import Element
+    from odf.namespaces import TABLENS
     HAS_ODF = True
 except ImportError:
     HAS_ODF = False
     print("Warning: odfpy not installed. ODS export will not be available.")
     print("Install with your package manager or: pip install odfpy")
 
+# Use the libyaml-backed loader when PyYAML was built with it (much faster
+# on large mods.yml files), otherwise fall back to the pure-Python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Distinct background colors for authors in ODS exports
+# Authors are assigned colors in order, cycling when there are more than 10
+COLORS = (
+    '#E6F3FF',  # Light Blue
+    '#FFE6E6',  # Light Red
+    '#E6FFE6',  # Light Green
+    '#FFF4E6',  # Light Orange
+    '#F0E6FF',  # Light Purple
+    '#FFFFE6',  # Light Yellow
+    '#FFE6F0',  # Light Pink
+    '#E6FFFF',  # Light Cyan
+    '#F5E6D3',  # Light Brown
+    '#E6E6FF',  # Light Lavender
+)
+
+# Manifest listing the parts written by save_ods()
+ODS_MANIFEST = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<manifest:manifest xmlns:manifest="urn:oasis:names:tc:opendocument:xmlns:manifest:1.0">'
+    '<manifest:file-entry manifest:full-path="/" manifest:media-type="{mimetype}"/>'
+    '<manifest:file-entry manifest:full-path="content.xml" manifest:media-type="text/xml"/>'
+    '<manifest:file-entry manifest:full-path="styles.xml" manifest:media-type="text/xml"/>'
+    '<manifest:file-entry manifest:full-path="meta.xml" manifest:media-type="text/xml"/>'
+    '</manifest:manifest>'
+)
+
+# Fully empty 6 column row for ODS exports
+BLANK_ROW_XML = '<table:table-row>' + '<table:table-cell/>' * 6 + '</table:table-row>'
+
+# Characters that are not allowed in XML 1.0 documents
+INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+
+
+def escape_xml(value):
+    """Escape a cell value for direct inclusion in ODS content.xml"""
+    return escape(INVALID_XML_CHARS.sub('\ufffd', str(value)))
+
+
+if HAS_ODF:
+    class RawTableRows(Element):
+        """
+        Block of pre-serialized <table:table-row> elements.
+
+        Building a TableRow/TableCell/P tree for every cell is slow for large
+        mod lists, so rows are rendered to an XML string and written verbatim
+        when the document is saved.
+
+        odfpy only writes automatic styles that are referenced from the
+        document tree, so the styles used by the rows are attached as
+        (never serialized) child cells to keep them in the output.
+        """
+
+        def __init__(self, xml, styles=()):
+            Element.__init__(self, qname=(TABLENS, 'table-row'), check_grammar=False)
+            self.xml = xml
+            for style in styles:
+                self.addElement(TableCell(stylename=style))
+
+        def toXml(self, level, f):
+            f.write(self.xml)
+
+
+def clear_screen():
+    """Clear the terminal with an ANSI escape sequence (no 'clear' subprocess)"""
+    sys.stdout.write('\x1b[2J\x1b[H')
+    sys.stdout.flush()
+
 
 def find_r2modman_base():
     """
@@ -77,7 +155,9 @@ def get_available_profiles():
         print("  - ~/.var/app/com.github.ebkr.r2modmanPlus/config/r2modmanPlus-local/Valheim/profiles (Flatpak)")
         sys.exit(1)
 
-    profiles = [p.name for p in r2modman_base.iterdir() if p.is_dir()]
+    # DirEntry.is_dir() uses the file type from the directory listing, no extra stat()
+    with os.scandir(r2modman_base) as entries:
+        profiles = [entry.name for entry in entries if entry.is_dir()]
     return profiles, r2modman_base
 
 
@@ -160,8 +240,15 @@ def load_mods(profile_name, r2modman_base):
 
     # Read and parse the YAML file
     # This contains the complete list of all mods installed in the profile
-    with open(mods_file, 'r', encoding='utf-8') as f:
-        mods_data = yaml.safe_load(f)
+    # The whole file is read as bytes in a single read() call (no buffered/text
+    # I/O layers) - the YAML loader handles the UTF-8 decoding
+    fd = os.open(mods_file, os.O_RDONLY)
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+    mods_data = yaml.load(data, Loader=YAML_LOADER)
 
     return mods_data
 
@@ -189,13 +276,24 @@ def parse_mod_info(mod):
     version = mod.get('versionNumber', {})
     version_str = f"{version.get('major', 0)}.{version.get('minor', 0)}.{version.get('patch', 0)}"
 
+    # Numeric version tuple for sorting: (5, 4, 2333)
+    try:
+        version_tuple = (int(version.get('major', 0)), int(version.get('minor', 0)), int(version.get('patch', 0)))
+    except (TypeError, ValueError):
+        # If version format is invalid, sort it as (0, 0, 0)
+        version_tuple = (0, 0, 0)
+
+    enabled = bool(mod.get('enabled', False))
+
     # Return cleaned and formatted mod information
     return {
         'name': mod.get('displayName', mod.get('name', 'Unknown')),  # Prefer displayName over internal name
-        'author': mod.get('authorName', 'Unknown'),
+        'author': sys.intern(mod.get('authorName', 'Unknown')),  # Interned, authors repeat across many mods
         'version': version_str,
+        'version_tuple': version_tuple,
         'description': mod.get('description', ''),
-        'enabled': 'Yes' if mod.get('enabled', False) else 'No',  # Convert boolean to readable text
+        'enabled': 'Yes' if enabled else 'No',  # Convert boolean to readable text
+        'enabled_bool': enabled,  # Raw flag, used for statistics
         'website': mod.get('websiteUrl', ''),  # Usually Thunderstore link
     }
 
@@ -205,7 +303,7 @@ def sort_mods(mods_list):
     return sorted(mods_list, key=lambda x: (x['author'].lower(), x['name'].lower()))
 
 
-def calculate_statistics(mods_list, profile_name):
+def calculate_statistics(mods_list, profile_name, now=None):
     """
     Calculate comprehensive statistics from the mod list.
 
@@ -220,46 +318,43 @@ def calculate_statistics(mods_list, profile_name):
     Args:
         mods_list: List of parsed mod dictionaries
         profile_name: Name of the profile being exported
+        now: Export time (datetime), defaults to the current time.
+             Pass the same value used for the file names so they match.
 
     Returns:
         Dictionary containing all calculated statistics
     """
-    # Count total mods and enabled/disabled breakdown
+    # Count enabled mods and how many mods each author has contributed
+    # in a single pass over the list
+    # Counter creates a dictionary: {'AuthorName': count, ...}
     total_mods = len(mods_list)
-    enabled_mods = sum(1 for mod in mods_list if mod['enabled'] == 'Yes')
+    enabled_mods = 0
+    author_counts = Counter()
+    for mod in mods_list:
+        enabled_mods += mod['enabled_bool']
+        author_counts[mod['author']] += 1
     disabled_mods = total_mods - enabled_mods
-
-    # Count how many mods each author has contributed
-    # Counter creates a dictionary: {'AuthorName': count, ...}
-    author_counts = Counter(mod['author'] for mod in mods_list)
     unique_authors = len(author_counts)
 
     # Get the top 5 authors by mod count
     # Returns list of tuples: [('AuthorName', count), ...]
     top_authors = author_counts.most_common(5)
 
-    # Sort mods by version number to find newest/oldest
-    # Version comparison: "5.4.2333" > "1.2.0"
-    def version_key(mod):
-        """Convert version string to tuple for proper numerical comparison"""
-        try:
-            # Split "5.4.2333" into ["5", "4", "2333"]
-            parts = mod['version'].split('.')
-            # Convert to tuple of integers: (5, 4, 2333)
-            return tuple(int(p) for p in parts)
-        except:
-            # If version format is invalid, return (0, 0, 0)
-            return (0, 0, 0)
-
-    # Sort by version (highest first) and get top 5
-    sorted_by_version = sorted(mods_list, key=version_key, reverse=True)
-    newest_mods = sorted_by_version[:5]  # First 5 = newest
-    oldest_mods = sorted_by_version[-5:][::-1]  # Last 5, reversed = oldest first
+    # Find the 5 newest/oldest mods by version number without sorting the whole list
+    # Version comparison uses the numeric tuple: (5, 4, 2333) > (1, 2, 0)
+    version_key = itemgetter('version_tuple')
+    newest_mods = heapq.nlargest(5, mods_list, key=version_key)
+    # Scanning the list backwards keeps the same order for mods with equal versions
+    # as taking the last 5 of a descending sort, oldest first
+    oldest_mods = heapq.nsmallest(5, reversed(mods_list), key=version_key)
+
+    if now is None:
+        now = datetime.now()
 
     # Compile all statistics into a dictionary
     stats = {
         'profile_name': profile_name,
-        'export_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'export_date': now.strftime("%Y-%m-%d %H:%M:%S"),
         'total_mods': total_mods,
         'enabled_mods': enabled_mods,
         'disabled_mods': disabled_mods,
@@ -272,23 +367,6 @@ def calculate_statistics(mods_list, profile_name):
     return stats
 
 
-def generate_colors(num_authors):
-    """Generate distinct colors for authors"""
-    colors = [
-        '#E6F3FF',  # Light Blue
-        '#FFE6E6',  # Light Red
-        '#E6FFE6',  # Light Green
-        '#FFF4E6',  # Light Orange
-        '#F0E6FF',  # Light Purple
-        '#FFFFE6',  # Light Yellow
-        '#FFE6F0',  # Light Pink
-        '#E6FFFF',  # Light Cyan
-        '#F5E6D3',  # Light Brown
-        '#E6E6FF',  # Light Lavender
-    ]
-    return [colors[i % len(colors)] for i in range(num_authors)]
-
-
 def ensure_output_dirs(base_dir):
     """Ensure csv_files and ods_files directories exist"""
     csv_dir = base_dir / "csv_files"
@@ -302,7 +380,8 @@ def ensure_output_dirs(base_dir):
 
 def export_to_csv(mods_list, output_file, stats):
     """Export mods to CSV file with statistics section"""
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+    # Use a large write buffer so the file is written in a few big chunks
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
         writer = csv.writer(f)
 
         # Write statistics section
@@ -343,20 +422,45 @@ def export_to_csv(mods_list, output_file, stats):
         headers = ['Author', 'Mod Name', 'Version', 'Enabled', 'Description', 'Website']
         writer.writerow(headers)
 
-        # Write mod data
-        for mod in mods_list:
-            writer.writerow([
-                mod['author'],
-                mod['name'],
-                mod['version'],
-                mod['enabled'],
-                mod['description'],
-                mod['website'],
-            ])
+        # Write mod data in one batch
+        writer.writerows([
+            (mod['author'], mod['name'], mod['version'], mod['enabled'], mod['description'], mod['website'])
+            for mod in mods_list
+        ])
 
     print(f"✓ CSV file created: {output_file.name}")
 
 
+def save_ods(doc, output_file):
+    """
+    Write an ODS document to disk as a DEFLATE compressed archive.
+
+    The XML parts are rendered by odfpy and zipped in memory, then the
+    finished archive is written to the output file in one go. Per the ODF
+    spec, "mimetype" is the first entry and is stored uncompressed.
+    """
+    now = datetime.now().timetuple()[:6]
+    parts = [
+        ('content.xml', doc.contentxml()),
+        ('styles.xml', doc.stylesxml().encode('utf-8')),
+        ('meta.xml', doc.metaxml().encode('utf-8')),
+        ('META-INF/manifest.xml', ODS_MANIFEST.format(mimetype=doc.mimetype).encode('utf-8')),
+    ]
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as z:
+        info = zipfile.ZipInfo('mimetype', now)
+        info.external_attr = 0o644 << 16
+        z.writestr(info, doc.mimetype.encode('utf-8'), compress_type=zipfile.ZIP_STORED)
+
+        for name, data in parts:
+            info = zipfile.ZipInfo(name, now)
+            info.external_attr = 0o644 << 16
+            z.writestr(info, data, compress_type=zipfile.ZIP_DEFLATED, compresslevel=6)
+
+    output_file.write_bytes(buffer.getvalue())
+
+
 def export_to_ods(mods_list, output_file, stats):
     """Export mods to ODS file with color coding and statistics"""
     if not HAS_ODF:
@@ -390,16 +494,19 @@ def export_to_ods(mods_list, output_file, stats):
     doc.automaticstyles.addElement(header_style)
 
     # Get unique authors and assign colors
-    authors = list(dict.fromkeys([mod['author'] for mod in mods_list]))
-    author_colors = dict(zip(authors, generate_colors(len(authors))))
-
-    # Create styles for each author
-    author_styles = {}
-    for author, color in author_colors.items():
-        style = Style(name=f"author_{author.replace(' ', '_').replace('-', '_')}", family="table-cell")
-        style.addElement(TableCellProperties(backgroundcolor=color))
-        doc.automaticstyles.addElement(style)
-        author_styles[author] = style
+    authors = dict.fromkeys(mod['author'] for mod in mods_list)
+    author_colors = {author: COLORS[i % len(COLORS)] for i, author in enumerate(authors)}
+
+    # Create one style per color actually used and share it between the
+    # authors that have that color
+    color_styles = {}
+    for color in author_colors.values():
+        if color not in color_styles:
+            style = Style(name=f"color_{COLORS.index(color)}", family="table-cell")
+            style.addElement(TableCellProperties(backgroundcolor=color))
+            doc.automaticstyles.addElement(style)
+            color_styles[color] = style
+    author_styles = {author: color_styles[color] for author, color in author_colors.items()}
 
     # Create table
     table = Table(name="Mods")
@@ -408,75 +515,83 @@ def export_to_ods(mods_list, output_file, stats):
     for _ in range(6):
         table.addElement(TableColumn())
 
-    # Add statistics section
+    # All rows are written straight to XML - one string per row instead of
+    # a TableRow + 6 TableCell + 6 P elements
+    rows_xml = io.StringIO()
+    used_styles = [stats_header_style, bold_style, section_header_style, header_style, *color_styles.values()]
+    style_attrs = {None: ''}
+    for style in used_styles:
+        style_attrs[style] = f' table:style-name={quoteattr(style.getAttribute("name"))}'
+
     def add_row(cells, style=None):
-        row = TableRow()
+        """Add a 6 column row, trailing cells that are not given are left empty"""
+        attr = style_attrs[style]
+        rows_xml.write('<table:table-row>')
         for cell_text in cells:
-            cell = TableCell(stylename=style) if style else TableCell()
-            cell.addElement(P(text=str(cell_text)))
-            row.addElement(cell)
-        table.addElement(row)
-        return row
+            rows_xml.write(f'<table:table-cell{attr}><text:p>{escape_xml(cell_text)}</text:p></table:table-cell>')
+        rows_xml.write(f'<table:table-cell{attr}/>' * (6 - len(cells)))
+        rows_xml.write('</table:table-row>')
+
+    def add_blank_row():
+        rows_xml.write(BLANK_ROW_XML)
 
     # Statistics header
-    add_row(['PROFILE STATISTICS', '', '', '', '', ''], stats_header_style)
-    add_row(['', '', '', '', '', ''])
-    add_row(['Profile Name:', stats['profile_name'], '', '', '', ''], bold_style)
-    add_row(['Export Date:', stats['export_date'], '', '', '', ''])
-    add_row(['Total Mods:', stats['total_mods'], '', '', '', ''])
-    add_row(['Enabled Mods:', stats['enabled_mods'], '', '', '', ''])
-    add_row(['Disabled Mods:', stats['disabled_mods'], '', '', '', ''])
-    add_row(['Unique Authors:', stats['unique_authors'], '', '', '', ''])
-    add_row(['', '', '', '', '', ''])
+    add_row(['PROFILE STATISTICS'], stats_header_style)
+    add_blank_row()
+    add_row(['Profile Name:', stats['profile_name']], bold_style)
+    add_row(['Export Date:', stats['export_date']])
+    add_row(['Total Mods:', stats['total_mods']])
+    add_row(['Enabled Mods:', stats['enabled_mods']])
+    add_row(['Disabled Mods:', stats['disabled_mods']])
+    add_row(['Unique Authors:', stats['unique_authors']])
+    add_blank_row()
 
     # Top authors
-    add_row(['TOP AUTHORS (by mod count)', '', '', '', '', ''], section_header_style)
+    add_row(['TOP AUTHORS (by mod count)'], section_header_style)
     for author, count in stats['top_authors']:
-        add_row([author, f"{count} mods", '', '', '', ''])
-    add_row(['', '', '', '', '', ''])
+        add_row([author, f"{count} mods"])
+    add_blank_row()
 
     # Newest mods
-    add_row(['NEWEST MODS (by version)', '', '', '', '', ''], section_header_style)
-    add_row(['Mod Name', 'Author', 'Version', '', '', ''], bold_style)
+    add_row(['NEWEST MODS (by version)'], section_header_style)
+    add_row(['Mod Name', 'Author', 'Version'], bold_style)
     for mod in stats['newest_mods']:
-        add_row([mod['name'], mod['author'], mod['version'], '', '', ''])
-    add_row(['', '', '', '', '', ''])
+        add_row([mod['name'], mod['author'], mod['version']])
+    add_blank_row()
 
     # Oldest mods
-    add_row(['OLDEST MODS (by version)', '', '', '', '', ''], section_header_style)
-    add_row(['Mod Name', 'Author', 'Version', '', '', ''], bold_style)
+    add_row(['OLDEST MODS (by version)'], section_header_style)
+    add_row(['Mod Name', 'Author', 'Version'], bold_style)
     for mod in stats['oldest_mods']:
-        add_row([mod['name'], mod['author'], mod['version'], '', '', ''])
-    add_row(['', '', '', '', '', ''])
-    add_row(['', '', '', '', '', ''])
+        add_row([mod['name'], mod['author'], mod['version']])
+    add_blank_row()
+    add_blank_row()
 
     # Main mod list header
-    add_row(['COMPLETE MOD LIST', '', '', '', '', ''], stats_header_style)
-    add_row(['', '', '', '', '', ''])
+    add_row(['COMPLETE MOD LIST'], stats_header_style)
+    add_blank_row()
 
     # Add main table header row
-    headers = ['Author', 'Mod Name', 'Version', 'Enabled', 'Description', 'Website']
-    header_row = TableRow()
-    for header_text in headers:
-        cell = TableCell(stylename=header_style)
-        cell.addElement(P(text=header_text))
-        header_row.addElement(cell)
-    table.addElement(header_row)
+    add_row(['Author', 'Mod Name', 'Version', 'Enabled', 'Description', 'Website'], header_style)
 
     # Add mod data rows with color coding
+    cell_open = {
+        author: f'<table:table-cell{style_attrs[style]}><text:p>'
+        for author, style in author_styles.items()
+    }
     for mod in mods_list:
-        row = TableRow()
-        style = author_styles[mod['author']]
-
+        cell = cell_open[mod['author']]
+        rows_xml.write('<table:table-row>')
         for field in ['author', 'name', 'version', 'enabled', 'description', 'website']:
-            cell = TableCell(stylename=style)
-            cell.addElement(P(text=str(mod[field])))
-            row.addElement(cell)
+            rows_xml.write(cell)
+            rows_xml.write(escape_xml(mod[field]))
+            rows_xml.write('</text:p></table:table-cell>')
+        rows_xml.write('</table:table-row>')
 
-        table.addElement(row)
+    table.addElement(RawTableRows(rows_xml.getvalue(), used_styles))
 
     doc.spreadsheet.addElement(table)
-    doc.save(output_file)
+    save_ods(doc, output_file)
 
     print(f"✓ ODS file created: {output_file.name}")
     print(f"  Statistics: {stats['total_mods']} total, {stats['enabled_mods']} enabled, {stats['unique_authors']} authors")
@@ -508,27 +623,21 @@ def load_csv_for_comparison(csv_file):
     mods = {}
 
     with open(csv_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
-        # Scan through the file to find the actual mod data header
+        # Read through the file to find the actual mod data header
         # We're looking for the line that starts with "Author,Mod Name,Version"
         # This appears after all the statistics sections
-        header_line_idx = None
-        for i, line in enumerate(lines):
+        for line in f:
             if line.strip().startswith('Author,Mod Name,Version'):
-                header_line_idx = i
                 break
-
-        if header_line_idx is None:
-            # If we can't find the header, the file format might be wrong
+        else:
+            # Reached the end without finding the header, the file format might be wrong
             print(f"Warning: Could not find mod data header in {csv_file.name}")
             return mods
 
-        # Create a new CSV reader starting from the header line
-        # This skips all the statistics sections above
-        import io
-        csv_data = io.StringIO(''.join(lines[header_line_idx:]))
-        reader = csv.DictReader(csv_data)
+        # Continue reading the same file with a CSV reader right after the
+        # header line, which is parsed here for the field names
+        # The statistics sections above are never kept in memory
+        reader = csv.DictReader(f, fieldnames=next(csv.reader([line])))
 
         # Read each mod entry and store it with a unique key
         for row in reader:
@@ -544,7 +653,10 @@ def load_csv_for_comparison(csv_file):
 
 def compare_exports(csv_dir):
     """Compare two CSV exports to show changes"""
-    csv_files = sorted(csv_dir.glob("*.csv"), key=lambda x: x.stat().st_mtime, reverse=True)
+    # DirEntry caches its stat() result, so sorting and listing stat each file once
+    with os.scandir(csv_dir) as entries:
+        csv_files = [entry for entry in entries if entry.name.endswith('.csv') and entry.is_file()]
+    csv_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
 
     if len(csv_files) < 2:
         print("\nError: Need at least 2 CSV files to compare!")
@@ -590,8 +702,9 @@ def compare_exports(csv_dir):
     mods1 = load_csv_for_comparison(file1)
     mods2 = load_csv_for_comparison(file2)
 
-    keys1 = set(mods1.keys())
-    keys2 = set(mods2.keys())
+    # Dict key views support set operations directly, no need to copy into sets
+    keys1 = mods1.keys()
+    keys2 = mods2.keys()
 
     added = keys1 - keys2
     removed = keys2 - keys1
@@ -607,7 +720,7 @@ def compare_exports(csv_dir):
             enabled_changes.append((key, mods2[key]['Enabled'], mods1[key]['Enabled']))
 
     # Clear screen for clean results display
-    os.system('clear')
+    clear_screen()
 
     # Display results
     print("="*60)
@@ -668,19 +781,20 @@ def export_mode(profiles, r2modman_base):
 
     print(f"Found {len(mods_data)} mods")
 
-    mods_list = [parse_mod_info(mod) for mod in mods_data]
-    mods_list = sort_mods(mods_list)
+    mods_list = sort_mods(parse_mod_info(mod) for mod in mods_data)
     print("Mods sorted by author and name")
 
+    # Read the clock once so the export date and the file names match
+    now = datetime.now()
+
     # Calculate statistics
-    stats = calculate_statistics(mods_list, profile_name)
+    stats = calculate_statistics(mods_list, profile_name, now)
 
     # Setup output directories
     output_dir = Path(__file__).parent
     csv_dir, ods_dir = ensure_output_dirs(output_dir)
 
     # Generate filenames with readable timestamp
-    now = datetime.now()
     timestamp = now.strftime("%b-%d-%Y_%I:%M%p")
     csv_file = csv_dir / f"{profile_name}_{timestamp}.csv"
     ods_file = ods_dir / f"{profile_name}_{timestamp}.ods"
@@ -691,7 +805,7 @@ def export_mode(profiles, r2modman_base):
     export_to_ods(mods_list, ods_file, stats)
 
     # Clear screen for clean results display
-    os.system('clear')
+    clear_screen()
 
     print("\n" + "="*60)
     print("  Export complete!")